@@ -1,19 +1,37 @@
-from datetime import datetime, timezone
-from typing import Dict
-from fcache.cache import FileCache
-from apscheduler.job import Job
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+import atexit
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import requests
 from UnleashClient.api import register_client
 from UnleashClient.periodic_tasks import fetch_and_load_features, aggregate_and_send_metrics
 from UnleashClient.strategies import ApplicationHostname, Default, GradualRolloutRandom, \
     GradualRolloutSessionId, GradualRolloutUserId, UserWithId, RemoteAddress
-from UnleashClient.constants import METRIC_LAST_SENT_TIME
+from UnleashClient.constants import METRIC_LAST_SENT_TIME, CACHE_FLUSH_INTERVAL
 from .utils import LOGGER
 
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python < 3.7
+    from .utils import ThreadLocalVar as ContextVar  # type: ignore
+
+# client: merged context, set by UnleashClient.request_context()
+_REQUEST_CONTEXT = ContextVar("unleash_request_context", default=None)  # type: ContextVar[Optional[Dict[Any, dict]]]
+
+# Initialized clients whose buffered cache writes are flushed at interpreter exit.
+_ACTIVE_CLIENTS = weakref.WeakSet()  # type: weakref.WeakSet
+
+
+@atexit.register
+def _flush_active_clients() -> None:
+    for client in list(_ACTIVE_CLIENTS):
+        client._flush_cache()  # pylint: disable=protected-access
+
 
 # pylint: disable=dangerous-default-value
-class UnleashClient():
+class UnleashClient():  # pylint: disable=too-many-instance-attributes
     """
     Client implementation.
 
@@ -45,7 +63,7 @@ class UnleashClient():
         :param cache_directory: Location of the cache directory. When unset, FCache will determine the location
         """
         # Configuration
-        self.unleash_url = url.rstrip('\\')
+        self.unleash_url = url.rstrip('/')
         self.unleash_app_name = app_name
         self.unleash_environment = environment
         self.unleash_instance_id = instance_id
@@ -60,13 +78,13 @@ class UnleashClient():
         }
 
         # Class objects
+        from fcache.cache import FileCache
         self.cache = FileCache(self.unleash_instance_id, app_cache_dir=cache_directory)
+        self.session = requests.Session()
         self.features = {}  # type: Dict
-        self.scheduler = BackgroundScheduler()
-        self.fl_job = None  # type: Job
-        self.metric_job = None  # type: Job
-        self.cache[METRIC_LAST_SENT_TIME] = datetime.now(timezone.utc)
-        self.cache.sync()
+        self._feature_is_enabled = {}  # type: Dict[str, Callable]
+        self.scheduler_thread = None  # type: threading.Thread
+        self.scheduler_stop_event = threading.Event()
 
         # Mappings
         default_strategy_mapping = {
@@ -96,6 +114,8 @@ class UnleashClient():
         :return:
         """
         # Setup
+        self.cache[METRIC_LAST_SENT_TIME] = time.time()
+
         fl_args = {
             "url": self.unleash_url,
             "app_name": self.unleash_app_name,
@@ -103,7 +123,8 @@ class UnleashClient():
             "custom_headers": self.unleash_custom_headers,
             "cache": self.cache,
             "features": self.features,
-            "strategy_mapping": self.strategy_mapping
+            "strategy_mapping": self.strategy_mapping,
+            "session": self.session
         }
 
         metrics_args = {
@@ -112,27 +133,27 @@ class UnleashClient():
             "instance_id": self.unleash_instance_id,
             "custom_headers": self.unleash_custom_headers,
             "features": self.features,
-            "ondisk_cache": self.cache
+            "ondisk_cache": self.cache,
+            "session": self.session
         }
 
         # Register app
         if not self.unleash_disable_registration:
             register_client(self.unleash_url, self.unleash_app_name, self.unleash_instance_id,
-                            self.unleash_metrics_interval, self.unleash_custom_headers, self.strategy_mapping)
+                            self.unleash_metrics_interval, self.unleash_custom_headers, self.strategy_mapping,
+                            self.session)
 
-        fetch_and_load_features(**fl_args)
+        self._fetch_and_load_features(**fl_args)
 
         # Start periodic jobs
-        self.scheduler.start()
-        self.fl_job = self.scheduler.add_job(fetch_and_load_features,
-                                             trigger=IntervalTrigger(seconds=int(self.unleash_refresh_interval)),
-                                             kwargs=fl_args)
-
-        if not self.unleash_disable_metrics:
-            self.metric_job = self.scheduler.add_job(aggregate_and_send_metrics,
-                                                     trigger=IntervalTrigger(seconds=int(self.unleash_metrics_interval)),
-                                                     kwargs=metrics_args)
+        self.scheduler_stop_event.clear()
+        self.scheduler_thread = threading.Thread(target=self._run_periodic_jobs,
+                                                 args=(fl_args, metrics_args),
+                                                 name="UnleashClient-scheduler",
+                                                 daemon=True)
+        self.scheduler_thread.start()
 
+        _ACTIVE_CLIENTS.add(self)
         self.is_initialized = True
 
     def destroy(self):
@@ -143,12 +164,106 @@ class UnleashClient():
 
         :return:
         """
-        self.fl_job.remove()
-        if self.metric_job:
-            self.metric_job.remove()
-        self.scheduler.shutdown()
+        self.scheduler_stop_event.set()
+        if self.scheduler_thread:
+            self.scheduler_thread.join()
+        self.session.close()
+        _ACTIVE_CLIENTS.discard(self)
         self.cache.delete()
 
+    # pylint: disable=broad-except
+    def _run_periodic_jobs(self,
+                           fl_args: dict,
+                           metrics_args: dict) -> None:
+        """
+        Runs the provisioning and metrics polls on their intervals until the scheduler is stopped.
+
+        Cache writes made by the jobs are buffered and flushed to disk at most every CACHE_FLUSH_INTERVAL seconds.
+
+        :param fl_args: Arguments for fetch_and_load_features()
+        :param metrics_args: Arguments for aggregate_and_send_metrics()
+        :return:
+        """
+        jobs = [(int(self.unleash_refresh_interval), self._fetch_and_load_features, fl_args)]  # type: List[Tuple[int, Callable, dict]]
+        if not self.unleash_disable_metrics:
+            jobs.append((int(self.unleash_metrics_interval), aggregate_and_send_metrics, metrics_args))
+
+        start_time = time.monotonic()
+        next_runs = [start_time + interval for interval, _, _ in jobs]
+        last_flush = start_time
+
+        while not self.scheduler_stop_event.wait(max(min(next_runs) - time.monotonic(), 0)):
+            now = time.monotonic()
+
+            for index, (interval, job, job_args) in enumerate(jobs):
+                if now < next_runs[index]:
+                    continue
+
+                try:
+                    job(**job_args)
+                except Exception as excep:
+                    LOGGER.warning("Error running periodic job %s: %s", job.__name__, excep)
+
+                # Missed runs are skipped rather than run back-to-back.
+                next_runs[index] = max(next_runs[index] + interval, time.monotonic())
+
+            if now - last_flush >= CACHE_FLUSH_INTERVAL:
+                self._flush_cache()
+                last_flush = now
+
+    # pylint: disable=broad-except
+    def _flush_cache(self) -> None:
+        """
+        Writes buffered cache entries to disk.
+
+        :return:
+        """
+        try:
+            self.cache.sync()
+        except Exception as excep:
+            LOGGER.warning("Error writing cache to disk: %s", excep)
+
+    def _fetch_and_load_features(self, **kwargs) -> None:
+        """
+        Fetches and loads features, then refreshes the cache of bound is_enabled methods used by is_enabled().
+
+        :param kwargs: Arguments for fetch_and_load_features()
+        :return:
+        """
+        fetch_and_load_features(**kwargs)
+        self._feature_is_enabled = {name: feature.is_enabled for name, feature in self.features.items()}
+
+    @contextmanager
+    def request_context(self, context: dict) -> Iterator[None]:
+        """
+        Shares one merged context across feature checks within a block (e.g. a web request).
+
+        Inside the block, is_enabled() and are_enabled() calls made without a context use this context.
+
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggles.
+        :return:
+        """
+        request_contexts = _REQUEST_CONTEXT.get() or {}
+        token = _REQUEST_CONTEXT.set({**request_contexts, self: {**context, **self.unleash_static_context}})
+        try:
+            yield
+        finally:
+            _REQUEST_CONTEXT.reset(token)
+
+    def _merge_context(self, context: dict) -> dict:
+        """
+        Merges static context into context, reusing the request context if no context was given.
+
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggles.
+        :return: Merged context
+        """
+        if not context:
+            request_contexts = _REQUEST_CONTEXT.get()
+            if request_contexts is not None and self in request_contexts:
+                return request_contexts[self]
+
+        return {**context, **self.unleash_static_context}
+
     # pylint: disable=broad-except
     def is_enabled(self,
                    feature_name: str,
@@ -165,16 +280,64 @@ class UnleashClient():
         :param default_value: Allows override of default value.
         :return: True/False
         """
-        context.update(self.unleash_static_context)
+        if not self.is_initialized:
+            LOGGER.warning("Returning default value for feature: %s", feature_name)
+            LOGGER.warning("Attempted to get feature_flag %s, but client wasn't initialized!", feature_name)
+            return default_value
+
+        feature_check = self._feature_is_enabled.get(feature_name)
+
+        if feature_check is None:
+            LOGGER.warning("Returning default value for feature: %s", feature_name)
+            LOGGER.warning("Feature flag %s not found.", feature_name)
+            return default_value
+
+        try:
+            return feature_check(self._merge_context(context), default_value)
+        except Exception as excep:
+            LOGGER.warning("Returning default value for feature: %s", feature_name)
+            LOGGER.warning("Error checking feature flag: %s", excep)
+            return default_value
+
+    # pylint: disable=broad-except
+    def are_enabled(self,
+                    feature_names: Iterable[str],
+                    context: dict = {},
+                    default_value: bool = False) -> Dict[str, bool]:
+        """
+        Checks if several feature toggles are enabled using the same context.
+
+        Notes:
+        * Context is merged with the static context once and shared by all checks.
+        * If client hasn't been initialized yet or an error occurs, flag will default to default_value.
+
+        :param feature_names: Names of the features
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggles.
+        :param default_value: Allows override of default value.
+        :return: Dictionary of feature name : True/False
+        """
+        if not self.is_initialized:
+            LOGGER.warning("Attempted to get feature_flags %s, but client wasn't initialized!", feature_names)
+            return {feature_name: default_value for feature_name in feature_names}
+
+        merged_context = self._merge_context(context)
+        feature_is_enabled = self._feature_is_enabled
+        results = {}
+
+        for feature_name in feature_names:
+            feature_check = feature_is_enabled.get(feature_name)
+
+            if feature_check is None:
+                LOGGER.warning("Returning default value for feature: %s", feature_name)
+                LOGGER.warning("Feature flag %s not found.", feature_name)
+                results[feature_name] = default_value
+                continue
 
-        if self.is_initialized:
             try:
-                return self.features[feature_name].is_enabled(context, default_value)
+                results[feature_name] = feature_check(merged_context, default_value)
             except Exception as excep:
                 LOGGER.warning("Returning default value for feature: %s", feature_name)
                 LOGGER.warning("Error checking feature flag: %s", excep)
-                return default_value
-        else:
-            LOGGER.warning("Returning default value for feature: %s", feature_name)
-            LOGGER.warning("Attempted to get feature_flag %s, but client wasn't initialized!", feature_name)
-            return default_value
+                results[feature_name] = default_value
+
+        return results
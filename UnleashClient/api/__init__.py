@@ -1,3 +1,3 @@
-from .features import get_feature_toggles
+from .features import get_feature_toggles, get_feature_toggles_with_etag
 from .register import register_client
 from .metrics import send_metrics
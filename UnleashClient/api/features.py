@@ -1,3 +1,4 @@
+from typing import Tuple
 import requests
 from UnleashClient.constants import REQUEST_TIMEOUT, FEATURES_URL
 from UnleashClient.utils import LOGGER
@@ -7,7 +8,8 @@ from UnleashClient.utils import LOGGER
 def get_feature_toggles(url: str,
                         app_name: str,
                         instance_id: str,
-                        custom_headers: dict) -> dict:
+                        custom_headers: dict,
+                        session: requests.Session = None) -> dict:
     """
     Retrieves feature flags from unleash central server.
 
@@ -19,8 +21,37 @@ def get_feature_toggles(url: str,
     :param app_name:
     :param instance_id:
     :param custom_headers:
+    :param session: Optional requests session to reuse connections.
     :return: Feature flags if successful, empty dict if not.
     """
+    (feature_toggles, _) = get_feature_toggles_with_etag(url, app_name, instance_id, custom_headers, session)
+
+    return feature_toggles
+
+
+def get_feature_toggles_with_etag(url: str,
+                                  app_name: str,
+                                  instance_id: str,
+                                  custom_headers: dict,
+                                  session: requests.Session = None,
+                                  cached_etag: str = '') -> Tuple[dict, str]:
+    """
+    Retrieves feature flags and their ETag from unleash central server.
+
+    Notes:
+    * If unsuccessful (i.e. not HTTP status code 200), exception will be caught and logged.
+      This is to allow "safe" error handling if unleash server goes down.
+    * If cached_etag is given and features haven't changed (HTTP status code 304), no feature flags are returned
+      and the cached ETag is passed back.
+
+    :param url:
+    :param app_name:
+    :param instance_id:
+    :param custom_headers:
+    :param session: Optional requests session to reuse connections.
+    :param cached_etag: ETag of the last successful fetch, optional.
+    :return: (Feature flags, ETag) if successful, (empty dict, cached ETag) if unchanged, (empty dict, '') if not.
+    """
     try:
         LOGGER.info("Getting feature flag.")
 
@@ -29,16 +60,23 @@ def get_feature_toggles(url: str,
             "UNLEASH-INSTANCEID": instance_id
         }
 
-        resp = requests.get(url + FEATURES_URL,
-                            headers={**custom_headers, **headers},
-                            timeout=REQUEST_TIMEOUT)
+        if cached_etag:
+            headers["If-None-Match"] = cached_etag
+
+        resp = (session or requests).get(url + FEATURES_URL,
+                                         headers={**custom_headers, **headers},
+                                         timeout=REQUEST_TIMEOUT)
+
+        if resp.status_code == 304:
+            LOGGER.info("Feature flags unchanged since last fetch.")
+            return {}, cached_etag
 
         if resp.status_code != 200:
             LOGGER.warning("unleash feature fetch failed!")
             raise Exception("unleash feature fetch failed!")
 
-        return resp.json()
+        return resp.json(), resp.headers.get("ETag", "")
     except Exception:
         LOGGER.exception("Unleash feature fetch failed!")
 
-    return {}
+    return {}, ""
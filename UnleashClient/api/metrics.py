@@ -7,7 +7,8 @@ from UnleashClient.utils import LOGGER
 # pylint: disable=broad-except
 def send_metrics(url: str,
                  request_body: dict,
-                 custom_headers: dict) -> bool:
+                 custom_headers: dict,
+                 session: requests.Session = None) -> bool:
     """
     Attempts to send metrics to Unleash server
 
@@ -19,16 +20,17 @@ def send_metrics(url: str,
     :param instance_id:
     :param metrics_interval:
     :param custom_headers:
+    :param session: Optional requests session to reuse connections.
     :return: true if registration successful, false if registration unsuccessful or exception.
     """
     try:
         LOGGER.info("Sending messages to with unleash @ %s", url)
         LOGGER.info("unleash metrics information: %s", request_body)
 
-        resp = requests.post(url + METRICS_URL,
-                             data=json.dumps(request_body),
-                             headers={**custom_headers, **APPLICATION_HEADERS},
-                             timeout=REQUEST_TIMEOUT)
+        resp = (session or requests).post(url + METRICS_URL,
+                                          data=json.dumps(request_body),
+                                          headers={**custom_headers, **APPLICATION_HEADERS},
+                                          timeout=REQUEST_TIMEOUT)
 
         if resp.status_code != 202:
             LOGGER.warning("unleash metrics submission failed.")
@@ -11,7 +11,8 @@ def register_client(url: str,
                     instance_id: str,
                     metrics_interval: int,
                     custom_headers: dict,
-                    supported_strategies: dict) -> bool:
+                    supported_strategies: dict,
+                    session: requests.Session = None) -> bool:
     """
     Attempts to register client with unleash server.
 
@@ -25,6 +26,7 @@ def register_client(url: str,
     :param metrics_interval:
     :param custom_headers:
     :param supported_strategies:
+    :param session: Optional requests session to reuse connections.
     :return: true if registration successful, false if registration unsuccessful or exception.
     """
     registation_request = {
@@ -40,10 +42,10 @@ def register_client(url: str,
         LOGGER.info("Registering unleash client with unleash @ %s", url)
         LOGGER.info("Registration request information: %s", registation_request)
 
-        resp = requests.post(url + REGISTER_URL,
-                             data=json.dumps(registation_request),
-                             headers={**custom_headers, **APPLICATION_HEADERS},
-                             timeout=REQUEST_TIMEOUT)
+        resp = (session or requests).post(url + REGISTER_URL,
+                                          data=json.dumps(registation_request),
+                                          headers={**custom_headers, **APPLICATION_HEADERS},
+                                          timeout=REQUEST_TIMEOUT)
 
         if resp.status_code != 202:
             LOGGER.warning("unleash client registration failed.")
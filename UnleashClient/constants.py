@@ -2,7 +2,9 @@
 SDK_NAME = "unleash-client-python"
 SDK_VERSION = "2.5.0"
 REQUEST_TIMEOUT = 30
+CACHE_FLUSH_INTERVAL = 5
 METRIC_LAST_SENT_TIME = "mlst"
+ETAG = "etag"
 
 # =Unleash=
 APPLICATION_HEADERS = {"Content-Type": "application/json"}
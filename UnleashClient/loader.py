@@ -1,8 +1,11 @@
-from fcache.cache import FileCache
+from typing import TYPE_CHECKING
 from UnleashClient.features import Feature
 from UnleashClient.constants import FEATURES_URL
 from UnleashClient.utils import LOGGER
 
+if TYPE_CHECKING:
+    from fcache.cache import FileCache
+
 
 # pylint: disable=broad-except
 def _create_strategies(provisioning: dict,
@@ -34,7 +37,7 @@ def _create_feature(provisioning: dict,
                    strategies=parsed_strategies)
 
 
-def load_features(cache: FileCache,
+def load_features(cache: 'FileCache',
                   feature_toggles: dict,
                   strategy_mapping: dict) -> None:
     """
@@ -50,14 +53,13 @@ def load_features(cache: FileCache,
 
         # Parse provisioning
         parsed_features = {}
-        feature_names = [d["name"] for d in feature_provisioning["features"]]
 
         for provisioning in feature_provisioning["features"]:
             parsed_features[provisioning["name"]] = provisioning
 
         # Delete old features/cache
         for feature in list(feature_toggles.keys()):
-            if feature not in feature_names:
+            if feature not in parsed_features:
                 del feature_toggles[feature]
 
         # Update existing objects
@@ -71,7 +73,7 @@ def load_features(cache: FileCache,
                 feature_for_update.strategies = parsed_strategies
 
         # Handle creation or deletions
-        new_features = list(set(feature_names) - set(feature_toggles.keys()))
+        new_features = list(set(parsed_features) - set(feature_toggles.keys()))
 
         for feature in new_features:
             feature_toggles[feature] = _create_feature(parsed_features[feature], strategy_mapping)
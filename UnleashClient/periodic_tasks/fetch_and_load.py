@@ -1,23 +1,32 @@
-from fcache.cache import FileCache
-from UnleashClient.api import get_feature_toggles
+from typing import TYPE_CHECKING
+import requests
+from UnleashClient.api import get_feature_toggles_with_etag
 from UnleashClient.loader import load_features
-from UnleashClient.constants import FEATURES_URL
+from UnleashClient.constants import FEATURES_URL, ETAG
 from UnleashClient.utils import LOGGER
 
+if TYPE_CHECKING:
+    from fcache.cache import FileCache
+
 
 def fetch_and_load_features(url: str,
                             app_name: str,
                             instance_id: str,
                             custom_headers: dict,
-                            cache: FileCache,
+                            cache: 'FileCache',
                             features: dict,
-                            strategy_mapping: dict) -> None:
-    feature_provisioning = get_feature_toggles(url, app_name, instance_id, custom_headers)
+                            strategy_mapping: dict,
+                            session: requests.Session = None) -> None:
+    (feature_provisioning, etag) = get_feature_toggles_with_etag(url, app_name, instance_id, custom_headers, session,
+                                                                 cache.get(ETAG, ""))
 
     if feature_provisioning:
         cache[FEATURES_URL] = feature_provisioning
-        cache.sync()
-    else:
+        cache[ETAG] = etag
+    elif not etag:
         LOGGER.warning("Unable to get feature flag toggles, using cached provisioning.")
+    elif features:
+        # Server returned 304 and loaded features already match the cached provisioning.
+        return
 
     load_features(cache, features, strategy_mapping)
@@ -1,40 +1,41 @@
-from collections import ChainMap
+import time
 from datetime import datetime, timezone
-import fcache
+from typing import TYPE_CHECKING
+import requests
 from UnleashClient.api import send_metrics
 from UnleashClient.constants import METRIC_LAST_SENT_TIME
 
+if TYPE_CHECKING:
+    from fcache.cache import FileCache
+
 
 def aggregate_and_send_metrics(url: str,
                                app_name: str,
                                instance_id: str,
                                custom_headers: dict,
                                features: dict,
-                               ondisk_cache: fcache.cache
+                               ondisk_cache: 'FileCache',
+                               session: requests.Session = None
                                ) -> None:
-    feature_stats_list = []
+    feature_stats = {}
 
-    for feature_name in features.keys():
-        feature_stats = {
-            features[feature_name].name: {
-                "yes": features[feature_name].yes_count,
-                "no": features[feature_name].no_count
-            }
+    # Counters aren't locked: increments landing between the read and reset_stats() are lost.
+    for feature in features.values():
+        feature_stats[feature.name] = {
+            "yes": feature.yes_count,
+            "no": feature.no_count
         }
-
-        features[feature_name].reset_stats()
-        feature_stats_list.append(feature_stats)
+        feature.reset_stats()
 
     metrics_request = {
         "appName": app_name,
         "instanceId": instance_id,
         "bucket": {
-            "start": ondisk_cache[METRIC_LAST_SENT_TIME].isoformat(),
+            "start": datetime.fromtimestamp(ondisk_cache[METRIC_LAST_SENT_TIME], timezone.utc).isoformat(),
             "stop": datetime.now(timezone.utc).isoformat(),
-            "toggles": dict(ChainMap(*feature_stats_list))
+            "toggles": feature_stats
         }
     }
 
-    send_metrics(url, metrics_request, custom_headers)
-    ondisk_cache[METRIC_LAST_SENT_TIME] = datetime.now(timezone.utc)
-    ondisk_cache.sync()
+    send_metrics(url, metrics_request, custom_headers, session)
+    ondisk_cache[METRIC_LAST_SENT_TIME] = time.time()
@@ -3,8 +3,13 @@ from UnleashClient.strategies import Strategy
 
 
 class ApplicationHostname(Strategy):
+    __slots__ = ("host_matches",)
+
     def load_provisioning(self) -> list:
-        return [x.strip() for x in self.parameters["hostNames"].split(',')]
+        host_names = [x.strip() for x in self.parameters["hostNames"].split(',')]
+        self.host_matches = platform.node() in host_names
+
+        return host_names
 
     def __call__(self, context: dict = None) -> bool:
         """
@@ -12,4 +17,4 @@ class ApplicationHostname(Strategy):
 
         :return:
         """
-        return platform.node() in self.parsed_provisioning
+        return self.host_matches
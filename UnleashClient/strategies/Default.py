@@ -2,6 +2,8 @@ from UnleashClient.strategies import Strategy
 
 
 class Default(Strategy):
+    __slots__ = ()
+
     def __call__(self, context: dict = None) -> bool:
         """
         Return true if enabled.
@@ -3,12 +3,17 @@ from UnleashClient.strategies import Strategy
 
 
 class GradualRolloutRandom(Strategy):
+    __slots__ = ("percentage",)
+
+    def load_provisioning(self) -> list:
+        self.percentage = int(self.parameters["percentage"])
+
+        return []
+
     def __call__(self, context: dict = None) -> bool:
         """
         Returns random assignment.
 
         :return:
         """
-        percentage = int(self.parameters["percentage"])
-
-        return percentage > 0 and random.randint(1, 100) <= percentage
+        return self.percentage >= 100 or (self.percentage > 0 and random.randint(1, 100) <= self.percentage)
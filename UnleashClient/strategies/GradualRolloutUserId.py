@@ -3,13 +3,18 @@ from UnleashClient.strategies import Strategy
 
 
 class GradualRolloutUserId(Strategy):
+    __slots__ = ("percentage", "activation_group")
+
+    def load_provisioning(self) -> list:
+        self.percentage = int(self.parameters["percentage"])
+        self.activation_group = self.parameters["groupId"]
+
+        return []
+
     def __call__(self, context: dict = None) -> bool:
         """
         Returns true if userId is a member of id list.
 
         :return:
         """
-        percentage = int(self.parameters["percentage"])
-        activation_group = self.parameters["groupId"]
-
-        return percentage > 0 and normalized_hash(context["userId"], activation_group) <= percentage
+        return self.percentage > 0 and normalized_hash(context["userId"], self.activation_group) <= self.percentage
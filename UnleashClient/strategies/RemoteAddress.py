@@ -4,6 +4,8 @@ from UnleashClient.utils import LOGGER
 
 
 class RemoteAddress(Strategy):
+    __slots__ = ()
+
     def load_provisioning(self) -> list:
         parsed_ips = []
 
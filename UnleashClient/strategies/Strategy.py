@@ -1,3 +1,6 @@
+from typing import Iterable
+
+
 # pylint: disable=dangerous-default-value
 class Strategy():
     """
@@ -5,6 +8,8 @@ class Strategy():
     * __call__() - Implementation of the strategy.
     * load_provisioning - Loads strategy provisioning
     """
+    __slots__ = ("parameters", "parsed_provisioning")
+
     def __init__(self,
                  parameters: dict = {}) -> None:
         """
@@ -19,7 +24,7 @@ class Strategy():
         self.parsed_provisioning = self.load_provisioning()
 
     # pylint: disable=no-self-use
-    def load_provisioning(self) -> list:
+    def load_provisioning(self) -> Iterable:
         """
         Method to load data on object initialization, if desired.
 
@@ -2,8 +2,10 @@ from UnleashClient.strategies import Strategy
 
 
 class UserWithId(Strategy):
-    def load_provisioning(self) -> list:
-        return [x.strip() for x in self.parameters["userIds"].split(',')]
+    __slots__ = ()
+
+    def load_provisioning(self) -> frozenset:
+        return frozenset(x.strip() for x in self.parameters["userIds"].split(','))
 
     def __call__(self, context: dict = None) -> bool:
         """
@@ -11,9 +13,4 @@ class UserWithId(Strategy):
 
         :return:
         """
-        return_value = False
-
-        if "userId" in context.keys():
-            return_value = context["userId"] in self.parsed_provisioning
-
-        return return_value
+        return context.get("userId") in self.parsed_provisioning
@@ -1,4 +1,5 @@
 import logging
+import threading
 import mmh3  # pylint: disable=import-error
 
 LOGGER = logging.getLogger(__name__)
@@ -7,3 +8,24 @@ LOGGER = logging.getLogger(__name__)
 def normalized_hash(identifier: str,
                     activation_group: str) -> int:
     return mmh3.hash("{}:{}".format(activation_group, identifier), signed=False) % 100 + 1
+
+
+class ThreadLocalVar(threading.local):
+    """
+    Stand-in for contextvars.ContextVar on Python < 3.7.  Values are per-thread rather than per-task.
+    """
+    def __init__(self, name: str, default=None) -> None:
+        super().__init__()
+        self.name = name
+        self.value = default
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        previous_value = self.value
+        self.value = value
+        return previous_value
+
+    def reset(self, token) -> None:
+        self.value = token
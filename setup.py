@@ -20,8 +20,7 @@ setup(
     packages=find_packages(),
     install_requires=["requests==2.22.0",
                       "fcache==0.4.7",
-                      "mmh3==2.5.1",
-                      "apscheduler==3.6.1"],
+                      "mmh3==2.5.1"],
     tests_require=['pytest', "mimesis", "responses"],
     zip_safe=False,
     include_package_data=True,
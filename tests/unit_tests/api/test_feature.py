@@ -1,11 +1,13 @@
+import requests
 import responses
 from tests.utilities.mocks.mock_features import MOCK_FEATURE_RESPONSE
-from tests.utilities.testing_constants import URL, APP_NAME, INSTANCE_ID, CUSTOM_HEADERS
+from tests.utilities.testing_constants import URL, APP_NAME, INSTANCE_ID, CUSTOM_HEADERS, SESSION_HEADERS
 from UnleashClient.constants import FEATURES_URL
-from UnleashClient.api import get_feature_toggles
+from UnleashClient.api import get_feature_toggles, get_feature_toggles_with_etag
 
 
 FULL_FEATURE_URL = URL + FEATURES_URL
+ETAG_VALUE = 'W/"730-v0ozrE11zfZK13j7rQ5PxkXfjYQ"'
 
 
 @responses.activate
@@ -32,3 +34,66 @@ def test_get_feature_toggle_failure():
 
     assert len(responses.calls) == 1
     assert not result
+
+
+@responses.activate
+def test_get_feature_toggle_with_etag_success():
+    responses.add(responses.GET, FULL_FEATURE_URL, json=MOCK_FEATURE_RESPONSE, status=200, headers={"ETag": ETAG_VALUE})
+
+    (result, etag) = get_feature_toggles_with_etag(URL,
+                                                   APP_NAME,
+                                                   INSTANCE_ID,
+                                                   CUSTOM_HEADERS)
+
+    assert len(responses.calls) == 1
+    assert result["version"] == 1
+    assert etag == ETAG_VALUE
+
+
+@responses.activate
+def test_get_feature_toggle_with_etag_failure():
+    responses.add(responses.GET, FULL_FEATURE_URL, json={}, status=500)
+
+    (result, etag) = get_feature_toggles_with_etag(URL,
+                                                   APP_NAME,
+                                                   INSTANCE_ID,
+                                                   CUSTOM_HEADERS,
+                                                   cached_etag=ETAG_VALUE)
+
+    assert len(responses.calls) == 1
+    assert not result
+    assert not etag
+
+
+@responses.activate
+def test_get_feature_toggle_etag_unchanged():
+    responses.add(responses.GET, FULL_FEATURE_URL, status=304)
+
+    (result, etag) = get_feature_toggles_with_etag(URL,
+                                                   APP_NAME,
+                                                   INSTANCE_ID,
+                                                   CUSTOM_HEADERS,
+                                                   cached_etag=ETAG_VALUE)
+
+    assert len(responses.calls) == 1
+    assert responses.calls[0].request.headers["If-None-Match"] == ETAG_VALUE
+    assert not result
+    assert etag == ETAG_VALUE
+
+
+@responses.activate
+def test_get_feature_toggle_session():
+    responses.add(responses.GET, FULL_FEATURE_URL, json=MOCK_FEATURE_RESPONSE, status=200)
+
+    with requests.Session() as session:
+        session.headers.update(SESSION_HEADERS)
+        result = get_feature_toggles(URL,
+                                     APP_NAME,
+                                     INSTANCE_ID,
+                                     CUSTOM_HEADERS,
+                                     session)
+
+    assert len(responses.calls) == 1
+    assert responses.calls[0].request.headers["X-Test-Session"] == "pytest"
+    assert responses.calls[0].request.headers["name"] == CUSTOM_HEADERS["name"]
+    assert result["version"] == 1
@@ -1,6 +1,7 @@
+import requests
 import responses
 from requests import ConnectionError
-from tests.utilities.testing_constants import URL, CUSTOM_HEADERS
+from tests.utilities.testing_constants import URL, CUSTOM_HEADERS, SESSION_HEADERS
 from tests.utilities.mocks.mock_metrics import MOCK_METRICS_REQUEST
 from UnleashClient.constants import METRICS_URL
 from UnleashClient.api import send_metrics
@@ -29,6 +30,19 @@ def test_send_metrics_failure():
     assert not result
 
 
+@responses.activate
+def test_send_metrics_session():
+    responses.add(responses.POST, FULL_METRICS_URL, json={}, status=202)
+
+    with requests.Session() as session:
+        session.headers.update(SESSION_HEADERS)
+        result = send_metrics(URL, MOCK_METRICS_REQUEST, CUSTOM_HEADERS, session)
+
+    assert len(responses.calls) == 1
+    assert responses.calls[0].request.headers["X-Test-Session"] == "pytest"
+    assert result
+
+
 @responses.activate
 def test_register_client_exception():
     responses.add(responses.POST, FULL_METRICS_URL, body=ConnectionError("Test connection error."), status=200)
@@ -1,8 +1,10 @@
+import requests
 import responses
 from requests import ConnectionError
 from UnleashClient.constants import REGISTER_URL
 from UnleashClient.api import register_client
-from tests.utilities.testing_constants import URL, APP_NAME, INSTANCE_ID, METRICS_INTERVAL, CUSTOM_HEADERS, DEFAULT_STRATEGY_MAPPING
+from tests.utilities.testing_constants import URL, APP_NAME, INSTANCE_ID, METRICS_INTERVAL, CUSTOM_HEADERS, \
+    DEFAULT_STRATEGY_MAPPING, SESSION_HEADERS
 
 
 FULL_REGISTER_URL = URL + REGISTER_URL
@@ -51,3 +53,22 @@ def test_register_client_exception():
 
     assert len(responses.calls) == 1
     assert not result
+
+
+@responses.activate
+def test_register_client_session():
+    responses.add(responses.POST, FULL_REGISTER_URL, json={}, status=202)
+
+    with requests.Session() as session:
+        session.headers.update(SESSION_HEADERS)
+        result = register_client(URL,
+                                 APP_NAME,
+                                 INSTANCE_ID,
+                                 METRICS_INTERVAL,
+                                 CUSTOM_HEADERS,
+                                 DEFAULT_STRATEGY_MAPPING,
+                                 session)
+
+    assert len(responses.calls) == 1
+    assert responses.calls[0].request.headers["X-Test-Session"] == "pytest"
+    assert result
@@ -1,5 +1,6 @@
 import json
-from datetime import datetime, timezone, timedelta
+import time
+from datetime import datetime, timezone
 import responses
 from fcache.cache import FileCache
 from tests.utilities.testing_constants import URL, APP_NAME, INSTANCE_ID, CUSTOM_HEADERS, IP_LIST
@@ -17,7 +18,7 @@ print(FULL_METRICS_URL)
 def test_aggregate_and_send_metrics():
     responses.add(responses.POST, FULL_METRICS_URL, json={}, status=200)
 
-    start_time = datetime.now(timezone.utc) - timedelta(seconds=60)
+    start_time = time.time() - 60
     cache = FileCache("TestCache")
     cache[METRIC_LAST_SENT_TIME] = start_time
     strategies = [RemoteAddress(parameters={"IPs": IP_LIST}), Default()]
@@ -39,4 +40,5 @@ def test_aggregate_and_send_metrics():
     assert len(request['bucket']["toggles"].keys()) == 2
     assert request['bucket']["toggles"]["My Feature1"]["yes"] == 1
     assert request['bucket']["toggles"]["My Feature1"]["no"] == 1
+    assert request['bucket']["start"] == datetime.fromtimestamp(start_time, timezone.utc).isoformat()
     assert cache[METRIC_LAST_SENT_TIME] > start_time
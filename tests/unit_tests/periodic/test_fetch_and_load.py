@@ -1,5 +1,5 @@
 import responses
-from UnleashClient.constants import FEATURES_URL
+from UnleashClient.constants import FEATURES_URL, ETAG
 from UnleashClient.periodic_tasks import fetch_and_load_features
 from UnleashClient.features import Feature
 from tests.utilities.mocks.mock_features import MOCK_FEATURE_RESPONSE
@@ -8,6 +8,7 @@ from tests.utilities.decorators import cache_empty  # noqa: F401
 
 
 FULL_FEATURE_URL = URL + FEATURES_URL
+ETAG_VALUE = 'W/"730-v0ozrE11zfZK13j7rQ5PxkXfjYQ"'
 
 
 @responses.activate
@@ -56,3 +57,36 @@ def test_fetch_and_load_failure(cache_empty):  # noqa: F811
                             DEFAULT_STRATEGY_MAPPING)
 
     assert isinstance(in_memory_features["testFlag"], Feature)
+
+
+@responses.activate
+def test_fetch_and_load_unchanged(cache_empty):  # noqa: F811
+    # Set up for tests
+    in_memory_features = {}
+    responses.add(responses.GET, FULL_FEATURE_URL, json=MOCK_FEATURE_RESPONSE, status=200, headers={"ETag": ETAG_VALUE})
+    temp_cache = cache_empty
+
+    fetch_and_load_features(URL,
+                            APP_NAME,
+                            INSTANCE_ID,
+                            CUSTOM_HEADERS,
+                            temp_cache,
+                            in_memory_features,
+                            DEFAULT_STRATEGY_MAPPING)
+    loaded_strategies = in_memory_features["testFlag"].strategies
+
+    # Server reports no changes
+    responses.reset()
+    responses.add(responses.GET, FULL_FEATURE_URL, status=304)
+
+    fetch_and_load_features(URL,
+                            APP_NAME,
+                            INSTANCE_ID,
+                            CUSTOM_HEADERS,
+                            temp_cache,
+                            in_memory_features,
+                            DEFAULT_STRATEGY_MAPPING)
+
+    assert responses.calls[0].request.headers["If-None-Match"] == ETAG_VALUE
+    assert temp_cache[ETAG] == ETAG_VALUE
+    assert in_memory_features["testFlag"].strategies is loaded_strategies
@@ -18,3 +18,8 @@ def test_object_eq():
 
     assert not gr1 == gr2
     assert gr1 == gr3
+
+
+def test_gradualrolloutrandom_bounds():
+    assert GradualRolloutRandom(parameters={"percentage": 100})()
+    assert not GradualRolloutRandom(parameters={"percentage": 0})()
@@ -16,3 +16,9 @@ def test_userwithid(strategy):
 
 def test_userwithid_missing_parameter(strategy):
     assert not strategy(context={})
+
+
+def test_userwithid_whitespace():
+    spaced_strategy = UserWithId(parameters={"userIds": "meep@meep.com, bleep@bleep.com"})
+    assert spaced_strategy(context={"userId": "bleep@bleep.com"})
+    assert not spaced_strategy(context={"userId": "bleep"})
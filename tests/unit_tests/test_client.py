@@ -1,5 +1,7 @@
+import gc
 import time
 import json
+import weakref
 import pytest
 import responses
 from UnleashClient import UnleashClient
@@ -8,6 +10,7 @@ from tests.utilities.testing_constants import URL, ENVIRONMENT, APP_NAME, INSTAN
     METRICS_INTERVAL, DISABLE_METRICS, DISABLE_REGISTRATION, CUSTOM_HEADERS
 from tests.utilities.mocks.mock_features import MOCK_FEATURE_RESPONSE
 from tests.utilities.mocks.mock_all_features import MOCK_ALL_FEATURES
+from tests.utilities.mocks.mock_custom_strategy import MOCK_CUSTOM_STRATEGY
 from UnleashClient.constants import REGISTER_URL, FEATURES_URL, METRICS_URL
 
 
@@ -42,18 +45,6 @@ def unleash_client(tmpdir):
     unleash_client.destroy()
 
 
-@pytest.fixture()
-def unleash_client_nodestroy(tmpdir):
-    unleash_client = UnleashClient(
-        URL,
-        APP_NAME,
-        refresh_interval=REFRESH_INTERVAL,
-        metrics_interval=METRICS_INTERVAL,
-        cache_directory=tmpdir.dirname
-    )
-    yield unleash_client
-
-
 @pytest.fixture()
 def unleash_client_toggle_only(tmpdir):
     unleash_client = UnleashClient(
@@ -94,6 +85,17 @@ def test_UC_initialize_full():
     assert client.unleash_custom_headers == CUSTOM_HEADERS
 
 
+def test_UC_trailing_slash():
+    client = UnleashClient(URL + "/", APP_NAME)
+    assert client.unleash_url == URL
+
+
+def test_UC_not_kept_alive():
+    client_ref = weakref.ref(UnleashClient(URL, APP_NAME))
+    gc.collect()
+    assert client_ref() is None
+
+
 def test_UC_type_violation():
     client = UnleashClient(URL, APP_NAME, refresh_interval="60")
     assert client.unleash_url == URL
@@ -118,6 +120,7 @@ def test_uc_lifecycle(unleash_client):
     responses.add(responses.GET, URL + FEATURES_URL, json=MOCK_ALL_FEATURES, status=200)
     time.sleep(30)
     assert len(unleash_client.features) == 7
+    assert unleash_client._feature_is_enabled.keys() == unleash_client.features.keys()
 
 
 @responses.activate
@@ -134,8 +137,7 @@ def test_uc_is_enabled(unleash_client):
 
 
 @responses.activate
-def test_uc_dirty_cache(unleash_client_nodestroy):
-    unleash_client = unleash_client_nodestroy
+def test_uc_dirty_cache(unleash_client):
     # Set up API
     responses.add(responses.POST, URL + REGISTER_URL, json={}, status=202)
     responses.add(responses.GET, URL + FEATURES_URL, json=MOCK_FEATURE_RESPONSE, status=200)
@@ -145,7 +147,8 @@ def test_uc_dirty_cache(unleash_client_nodestroy):
     unleash_client.initialize_client()
     time.sleep(5)
     assert unleash_client.is_enabled("testFlag")
-    unleash_client.scheduler.shutdown()
+    unleash_client.scheduler_stop_event.set()
+    unleash_client.scheduler_thread.join()
 
     # Check that everything works if previous cache exists.
     unleash_client.initialize_client()
@@ -173,6 +176,21 @@ def test_uc_is_enabled_with_context():
     unleash_client.destroy()
 
 
+@responses.activate
+def test_uc_is_enabled_context_not_mutated(unleash_client):
+    # Set up API
+    responses.add(responses.POST, URL + REGISTER_URL, json={}, status=202)
+    responses.add(responses.GET, URL + FEATURES_URL, json=MOCK_FEATURE_RESPONSE, status=200)
+    responses.add(responses.POST, URL + METRICS_URL, json={}, status=202)
+
+    # Create Unleash client and check initial load
+    unleash_client.initialize_client()
+    time.sleep(1)
+    context = {"userId": "test@test.com"}
+    assert unleash_client.is_enabled("testFlag", context)
+    assert context == {"userId": "test@test.com"}
+
+
 @responses.activate
 def test_uc_is_enabled_error_states(unleash_client):
     # Set up API
@@ -187,11 +205,90 @@ def test_uc_is_enabled_error_states(unleash_client):
     assert unleash_client.is_enabled("ThisFlagDoesn'tExist", default_value=True)
 
 
+@responses.activate
+def test_uc_are_enabled(unleash_client):
+    # Set up API
+    responses.add(responses.POST, URL + REGISTER_URL, json={}, status=202)
+    responses.add(responses.GET, URL + FEATURES_URL, json=MOCK_FEATURE_RESPONSE, status=200)
+    responses.add(responses.POST, URL + METRICS_URL, json={}, status=202)
+
+    # Create Unleash client and check initial load
+    unleash_client.initialize_client()
+    time.sleep(1)
+    assert unleash_client.are_enabled(["testFlag", "ThisFlagDoesn'tExist"]) == {
+        "testFlag": True,
+        "ThisFlagDoesn'tExist": False
+    }
+    assert unleash_client.are_enabled(["ThisFlagDoesn'tExist"], default_value=True) == {"ThisFlagDoesn'tExist": True}
+
+
+@pytest.fixture()
+def unleash_client_pair(tmpdir):
+    clients = [
+        UnleashClient(URL,
+                      APP_NAME,
+                      instance_id=instance_id,
+                      disable_metrics=True,
+                      disable_registration=True,
+                      cache_directory=str(tmpdir))
+        for instance_id in ("client-a", "client-b")
+    ]
+    yield clients
+    for unleash_client in clients:
+        unleash_client.destroy()
+
+
+@responses.activate
+def test_uc_request_context(unleash_client_pair):
+    unleash_client = unleash_client_pair[0]
+    responses.add(responses.GET, URL + FEATURES_URL, json=MOCK_CUSTOM_STRATEGY, status=200)
+    unleash_client.initialize_client()
+
+    with unleash_client.request_context({"userId": "meep@meep.com"}):
+        assert unleash_client.is_enabled("UserWithId")
+        assert unleash_client.are_enabled(["UserWithId"]) == {"UserWithId": True}
+        assert not unleash_client.is_enabled("UserWithId", {"userId": "nope@nope.com"})
+
+    assert not unleash_client.is_enabled("UserWithId")
+
+
+@responses.activate
+def test_uc_request_context_nested(unleash_client_pair):
+    unleash_client = unleash_client_pair[0]
+    responses.add(responses.GET, URL + FEATURES_URL, json=MOCK_CUSTOM_STRATEGY, status=200)
+    unleash_client.initialize_client()
+
+    with unleash_client.request_context({"userId": "meep@meep.com"}):
+        with unleash_client.request_context({"userId": "nope@nope.com"}):
+            assert not unleash_client.is_enabled("UserWithId")
+
+        assert unleash_client.is_enabled("UserWithId")
+
+    assert not unleash_client.is_enabled("UserWithId")
+
+
+@responses.activate
+def test_uc_request_context_other_client(unleash_client_pair):
+    (client_a, client_b) = unleash_client_pair
+    responses.add(responses.GET, URL + FEATURES_URL, json=MOCK_CUSTOM_STRATEGY, status=200)
+    client_a.initialize_client()
+    client_b.initialize_client()
+
+    with client_a.request_context({"userId": "meep@meep.com"}):
+        assert client_a.is_enabled("UserWithId")
+        assert not client_b.is_enabled("UserWithId")
+
+        with client_b.request_context({"userId": "test@test.com"}):
+            assert client_a.is_enabled("UserWithId")
+            assert client_b.is_enabled("UserWithId")
+
+
 @responses.activate
 def test_uc_not_initialized():
     unleash_client = UnleashClient(URL, APP_NAME)
     assert not unleash_client.is_enabled("ThisFlagDoesn'tExist")
     assert unleash_client.is_enabled("ThisFlagDoesn'tExist", default_value=True)
+    assert unleash_client.are_enabled(["ThisFlagDoesn'tExist"], default_value=True) == {"ThisFlagDoesn'tExist": True}
 
 
 @responses.activate
@@ -42,3 +42,4 @@ def test_uc_custom_strategy():
 
     assert unleash_client.is_enabled("CustomToggle", {"sound": "meow"})
     assert not unleash_client.is_enabled("CustomToggle", {"sound": "bark"})
+    unleash_client.destroy()
@@ -0,0 +1,35 @@
+import threading
+from UnleashClient.utils import normalized_hash, ThreadLocalVar
+
+
+def test_normalized_hash():
+    # Reference values from the Unleash Node.js client.
+    assert normalized_hash("123", "gr1") == 73
+    assert normalized_hash("999", "groupX") == 25
+
+
+def test_threadlocalvar_set_reset():
+    local_var = ThreadLocalVar("test", default=None)
+
+    outer_token = local_var.set("outer")
+    inner_token = local_var.set("inner")
+    assert local_var.get() == "inner"
+
+    local_var.reset(inner_token)
+    assert local_var.get() == "outer"
+
+    local_var.reset(outer_token)
+    assert local_var.get() is None
+
+
+def test_threadlocalvar_per_thread():
+    local_var = ThreadLocalVar("test", default=None)
+    local_var.set("main")
+    thread_values = []
+
+    thread = threading.Thread(target=lambda: thread_values.append(local_var.get()))
+    thread.start()
+    thread.join()
+
+    assert thread_values == [None]
+    assert local_var.get() == "main"